@@ -27,9 +27,6 @@ async def main():
         print("Disconnecting from the device.")
         await orphe.disconnect()
 
-        # 1秒待ってから終了（orphe_core.py内の監視プログラムの終了を待ため）
-        await asyncio.sleep(1)
-
 # 色々記述していますが，Ctrl+Cでプログラムを終了した場合にきれいに終了処理するためのものです．最悪 asyncio.run(main()) だけでも動きます．
 if __name__ == "__main__":
     loop = asyncio.new_event_loop()
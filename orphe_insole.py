@@ -1,6 +1,8 @@
 import asyncio
+import logging
 import struct
-from datetime import datetime, timedelta
+import sys
+from datetime import date, datetime, timedelta
 from bleak import BleakClient, BleakScanner
 
 
@@ -14,6 +16,53 @@ SERVICE_ORPHE_INFORMATION_UUID = "01a9d6b5-ff6e-444a-b266-0be75e85c064"
 SERVICE_OTHER_UUID = "db1b7aca-cda5-4453-a49b-33a53d3f0833"
 
 WRITE_WAIT_INTERVAL_SEC = 0.5
+SCAN_TIMEOUT_SEC = 10.0
+SENSOR_VALUES_QUEUE_SIZE = 256  # 解析待ちのセンサ値パケットを溜めておく最大数
+
+_log = logging.getLogger(__name__)
+
+# レンジ設定値（0,1,2,3）に対応する加速度[g]とジャイロ[deg/s]のフルスケール
+_ACC_AMPS = (2, 4, 8, 16)
+_GYRO_AMPS = (250, 500, 1000, 2000)
+# 加速度[g]とジャイロ[deg/s]のフルスケールからレンジ設定値（0,1,2,3）への変換表
+_ACC_MAP = {amp: i for i, amp in enumerate(_ACC_AMPS)}
+_GYRO_MAP = {amp: i for i, amp in enumerate(_GYRO_AMPS)}
+# 生値（int16）を -1.0〜1.0 に正規化する係数
+_RAW_SCALE = 1 / 32768
+# レンジ設定値ごとの、生値（int16）1あたりの加速度[g]とジャイロ[deg/s]
+_ACC_SCALES = tuple(amp * _RAW_SCALE for amp in _ACC_AMPS)
+_GYRO_SCALES = tuple(amp * _RAW_SCALE for amp in _GYRO_AMPS)
+
+# 0〜255を2桁の16進数(大文字)に変換する表
+_HEX2 = tuple(format(i, '02X') for i in range(256))
+
+# ビッグエンディアンのUint16（歩数）
+_U16BE = struct.Struct('>H')
+# センサ値パケットのヘッダ（タイプ, シリアルナンバー, 時, 分, 秒, ミリ秒）
+_SENSOR_HEADER = struct.Struct('>BH3BH')
+
+# センサ値パケットのサブパケット1つ分のフォーマット（ビッグエンディアン）
+# type=50: クオータニオン(w,x,y,z), ジャイロ(x,y,z), 加速度(x,y,z), 経過時間[ms]
+_S50 = struct.Struct('>10hB')
+# type=55: ジャイロ(x,y,z), 加速度(x,y,z), 圧力(6ch)
+_S55 = struct.Struct('>6h6H')
+# type=56: クオータニオン(w,x,y,z), ジャイロ(x,y,z), 加速度(x,y,z), 圧力(6ch)
+_S56 = struct.Struct('>10h6H')
+
+# ステップ解析パケットのフォーマット（data[2]以降、ビッグエンディアン）
+# Gait Overview: 歩数, 歩容タイプ/ストライド方向, (予約), カロリー, 移動距離, 立脚期, 遊脚期
+_GAIT = struct.Struct('>HBxefff')
+# Stride: 歩数, フットアングル, ストライドX, Y, Z
+_STRIDE = struct.Struct('>Hffff')
+# Pronation: 歩数, 着地衝撃力, プロネーションX, Y, Z
+_PRONATION = struct.Struct('>Hffff')
+# Quaternion: 歩数, フェイズ/ピリオド/イベント, (予約), クオータニオン(w,x,y,z), 移動距離(x,y,z)
+_QUAT_DISTANCE = struct.Struct('>HBx7e')
+
+
+# 当日0時のUNIXタイムスタンプ[ms]のキャッシュ（日付が変わったら更新する）
+_midnight_day = None
+_midnight_ms = 0
 
 
 def to_timestamp(hours, minutes, seconds, ms_high, ms_low):
@@ -27,18 +76,26 @@ def to_timestamp(hours, minutes, seconds, ms_high, ms_low):
         ms_high: ミリ秒の上位バイト
         ms_low: ミリ秒の下位バイト
     """
-    # 現在の日付を取得
-    now = datetime.now()
-
     # ミリ秒を上位バイトと下位バイトから計算
-    milliseconds = (ms_high << 8) | ms_low
+    return _clock_to_timestamp(hours, minutes, seconds, (ms_high << 8) | ms_low)
+
+
+def _clock_to_timestamp(hours, minutes, seconds, milliseconds):
+    """
+    時・分・秒・ミリ秒から当日のUNIXタイムスタンプ[ms]を計算する
+    """
+    global _midnight_day, _midnight_ms
 
-    # 日付を置き換えて、新しいdatetimeオブジェクトを作成
-    dt = now.replace(hour=hours, minute=minutes, second=seconds,
-                     microsecond=milliseconds * 1000)
+    # 現在の日付の0時のタイムスタンプは日付が変わったときだけ計算する
+    today = date.today()
+    if today != _midnight_day:
+        _midnight_ms = int(datetime(today.year, today.month,
+                           today.day).timestamp()) * 1000
+        _midnight_day = today
 
     # UNIXタイムスタンプを返す（MSまで含めた整数）
-    return int(dt.timestamp()*1000)
+    return (_midnight_ms + hours * 3_600_000 + minutes * 60_000
+            + seconds * 1000 + milliseconds)
 
 
 class AccData:
@@ -54,18 +111,29 @@ class AccData:
         packet_number: パケットナンバー
     """
 
-    def __init__(self):
-        self.x = 0
-        self.y = 0
-        self.z = 0
-        self.timestamp = 0
-        self.serial_number = 0
-        self.packet_number = 0
+    __slots__ = ('x', 'y', 'z', 'timestamp', 'serial_number', 'packet_number')
+
+    def __init__(self, x=0, y=0, z=0, timestamp=0, serial_number=0,
+                 packet_number=0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.timestamp = timestamp
+        self.serial_number = serial_number
+        self.packet_number = packet_number
 
     def print(self):
         print(
             f"Acc[{self.serial_number}][{self.packet_number}][{self.timestamp}]: {self.x}, {self.y}, {self.z}")
 
+    def log(self, level=logging.DEBUG):
+        """
+        print()と同じ内容をloggingで出力する。指定したレベルが無効な場合は文字列を生成しない
+        """
+        if _log.isEnabledFor(level):
+            _log.log(level, "Acc[%d][%d][%d]: %s, %s, %s", self.serial_number,
+                     self.packet_number, self.timestamp, self.x, self.y, self.z)
+
 
 class GyroData:
     """
@@ -80,18 +148,29 @@ class GyroData:
         packet_number: パケットナンバー
     """
 
-    def __init__(self):
-        self.x = 0
-        self.y = 0
-        self.z = 0
-        self.timestamp = 0
-        self.serial_number = 0
-        self.packet_number = 0
+    __slots__ = ('x', 'y', 'z', 'timestamp', 'serial_number', 'packet_number')
+
+    def __init__(self, x=0, y=0, z=0, timestamp=0, serial_number=0,
+                 packet_number=0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.timestamp = timestamp
+        self.serial_number = serial_number
+        self.packet_number = packet_number
 
     def print(self):
         print(
             f"Gyro[{self.serial_number}][{self.packet_number}][{self.timestamp}]: {self.x}, {self.y}, {self.z}")
 
+    def log(self, level=logging.DEBUG):
+        """
+        print()と同じ内容をloggingで出力する。指定したレベルが無効な場合は文字列を生成しない
+        """
+        if _log.isEnabledFor(level):
+            _log.log(level, "Gyro[%d][%d][%d]: %s, %s, %s", self.serial_number,
+                     self.packet_number, self.timestamp, self.x, self.y, self.z)
+
 
 class QuatData:
     """
@@ -107,41 +186,64 @@ class QuatData:
         packet_number: パケットナンバー
     """
 
-    def __init__(self):
-        self.w = 0
-        self.x = 0
-        self.y = 0
-        self.z = 0
-        self.timestamp = 0
-        self.serial_number = 0
-        self.packet_number = 0
+    __slots__ = ('w', 'x', 'y', 'z', 'timestamp', 'serial_number',
+                 'packet_number')
+
+    def __init__(self, w=0, x=0, y=0, z=0, timestamp=0, serial_number=0,
+                 packet_number=0):
+        self.w = w
+        self.x = x
+        self.y = y
+        self.z = z
+        self.timestamp = timestamp
+        self.serial_number = serial_number
+        self.packet_number = packet_number
 
     def print(self):
         print(
             f"Quat[{self.serial_number}][{self.packet_number}][{self.timestamp}]: {self.w}, {self.x}, {self.y}, {self.z}")
 
+    def log(self, level=logging.DEBUG):
+        """
+        print()と同じ内容をloggingで出力する。指定したレベルが無効な場合は文字列を生成しない
+        """
+        if _log.isEnabledFor(level):
+            _log.log(level, "Quat[%d][%d][%d]: %s, %s, %s, %s", self.serial_number,
+                     self.packet_number, self.timestamp, self.w, self.x, self.y, self.z)
+
 
 class PressureData:
     """
     圧力センサの値を格納するクラス
 
     Attributes:
-        values[6]: センサの圧力値
+        values[6]: センサの圧力値（タプル）
         timestamp: タイムスタンプ
         serial_number: シリアルナンバー
         packet_number: パケットナンバー
     """
 
-    def __init__(self):
-        self.values = [6]*0
-        self.timestamp = 0
-        self.serial_number = 0
-        self.packet_number = 0
+    __slots__ = ('values', 'timestamp', 'serial_number', 'packet_number')
+
+    def __init__(self, values=(), timestamp=0, serial_number=0,
+                 packet_number=0):
+        self.values = values
+        self.timestamp = timestamp
+        self.serial_number = serial_number
+        self.packet_number = packet_number
 
     def print(self):
         print(
             f"Pressure[{self.serial_number}][{self.packet_number}][{self.timestamp}]: {self.values}")
 
+    def log(self, level=logging.DEBUG):
+        """
+        print()と同じ内容をloggingで出力する。指定したレベルが無効な場合は文字列を生成しない
+        """
+        if _log.isEnabledFor(level):
+            _log.log(level, "Pressure[%d][%d][%d]: %s", self.serial_number,
+                     self.packet_number, self.timestamp, self.values)
+
 
 class Range:
     """
@@ -152,6 +254,8 @@ class Range:
         gyro: ジャイロセンサのレンジ
     """
 
+    __slots__ = ('acc', 'gyro')
+
     def __init__(self):
         self.acc = 0
         self.gyro = 0
@@ -172,21 +276,19 @@ class GaitData:
     """
 
     def __init__(self, data):
-        # 2,3は Uint16 で歩数が入っている
-        self.step_count = int.from_bytes(
-            data[2:4], byteorder='big', signed=False)
-        # 4番目は最初の2ビット分が enumで歩容タイプ（0:無し、1:歩行、2:走行,3:直立静止）
-        self.gait_type = data[4] & 0b11000000 >> 6
-        # 4番目は2,3,4ビット分がenumでストライド方向（0:なし, 1:前方, 2:後方,3:内側,4:外側）
-        self.direction = (data[4] & 0b00111000) >> 3
-        # data[6],data[7]はfloat16で総消費カロリー
-        self.calorie = struct.unpack('>e', data[6:8])
+        # 2,3は Uint16 で歩数
+        # 4はビットフィールド（歩容タイプ、ストライド方向）
+        # 6,7はfloat16で総消費カロリー
         # 8,9,10,11はfloat32で総移動距離
-        self.distance = struct.unpack('>f', data[8:12])
         # 12,13,14,15はfloat32で立脚期継続時間（standing phase duration）
-        self.standing_phase_duration = struct.unpack('>f', data[12:16])
-        # 16,17,18,19はflaot32で遊脚期継続時間（swing_phase_duration)
-        self.swing_phase_duration = struct.unpack('>f', data[16:20])
+        # 16,17,18,19はfloat32で遊脚期継続時間（swing_phase_duration)
+        (self.step_count, gait_bits, self.calorie, self.distance,
+         self.standing_phase_duration,
+         self.swing_phase_duration) = _GAIT.unpack_from(data, 2)
+        # 最初の2ビット分が enumで歩容タイプ（0:無し、1:歩行、2:走行,3:直立静止）
+        self.gait_type = (gait_bits & 0b11000000) >> 6
+        # 2,3,4ビット分がenumでストライド方向（0:なし, 1:前方, 2:後方,3:内側,4:外側）
+        self.direction = (gait_bits & 0b00111000) >> 3
 
     def print(self):
         print(f"Step count: {self.step_count}")
@@ -211,17 +313,13 @@ class StrideData:
     """
 
     def __init__(self, data):
-        # 2,3は Uint16 で歩数が入っている
-        self.step_count = int.from_bytes(
-            data[2:4], byteorder='big', signed=False)
+        # 2,3は Uint16 で歩数
         # 4,5,6,7はfloat32でフットアングル
-        self.foot_angle = struct.unpack('>f', data[4:8])
         # 8,9,10,11はfloat32でストライドX
-        self.x = struct.unpack('>f', data[8:12])
         # 12,13,14,15はfloat32でストライドY
-        self.y = struct.unpack('>f', data[12:16])
         # 16,17,18,19はfloat32でストライドZ
-        self.z = struct.unpack('>f', data[16:20])
+        (self.step_count, self.foot_angle,
+         self.x, self.y, self.z) = _STRIDE.unpack_from(data, 2)
 
     def print(self):
         print(f"Step count: {self.step_count}")
@@ -244,17 +342,13 @@ class PronationData:
     """
 
     def __init__(self, data):
-        # 2,3は Uint16 で歩数が入っている
-        self.step_count = int.from_bytes(
-            data[2:4], byteorder='big', signed=False)
+        # 2,3は Uint16 で歩数
         # 4,5,6,7はfloat32で着地衝撃力[kgf](landing_impact)
-        self.landing_impact = struct.unpack('>f', data[4:8])
         # 8,9,10,11はプロネーションX[deg](x)
-        self.x = struct.unpack('>f', data[8:12])
         # 12,13,14,15はプロネーションY[deg](y)
-        self.y = struct.unpack('>f', data[12:16])
         # 16,17,18,19はプロネーションZ[deg](z)
-        self.z = struct.unpack('>f', data[16:20])
+        (self.step_count, self.landing_impact,
+         self.x, self.y, self.z) = _PRONATION.unpack_from(data, 2)
 
     def print(self):
         print(f"Step count: {self.step_count}")
@@ -283,29 +377,19 @@ class QuatDistanceData:
     """
 
     def __init__(self, data):
-        # 2,3は Uint16 で歩数が入っている
-        self.step_count = int.from_bytes(
-            data[2:4], byteorder='big', signed=False)
-        # 4は01ビットがenumの歩容フェイズ（0:なし, 1:立脚期, 2:遊脚期）
-        self.phase = data[4] & 0b00000001
-        # 4は2,3,4ビットがenumの歩容ピリオド（0:なし,1:LoadingResponse, 2:MidStance, 3:TerminalStance, 4:InitialSwing, 5:MidSwing, 6:TerminalSwing）
-        self.period = (data[4] & 0b00011110) >> 1
-        # 4は5,6,7ビットがenumの歩容イベント(0:なし, 1:InitialContact, 2:FootFlat, 3:HeelRise, 4:ToeOff, 5:FeetAdjacent, 6:TibiaVertical)
-        self.event = (data[4] & 0b11100000) >> 5
-        # 6,7はfloat16でクォータニオンのw
-        self.w = struct.unpack('>e', data[6:8])
-        # 8,9はfloat16でクォータニオンのx
-        self.x = struct.unpack('>e', data[8:10])
-        # 10,11はfloat16でクォータニオンのy
-        self.y = struct.unpack('>e', data[10:12])
-        # 12,13はfloat16でクォータニオンのz
-        self.z = struct.unpack('>e', data[12:14])
-        # 14,15はfloat16で加速度力算出された単位時間のx移動距離
-        self.x_distance = struct.unpack('>e', data[14:16])
-        # 16,17はfloat16で加速度力算出された単位時間のy移動距離
-        self.y_distance = struct.unpack('>e', data[16:18])
-        # 18,19はfloat16で加速度力算出された単位時間のz移動距離
-        self.z_distance = struct.unpack('>e', data[18:20])
+        # 2,3は Uint16 で歩数
+        # 4はビットフィールド（歩容フェイズ、歩容ピリオド、歩容イベント）
+        # 6,7,8,9,10,11,12,13はfloat16でクォータニオンのw,x,y,z
+        # 14,15,16,17,18,19はfloat16で加速度力算出された単位時間のx,y,z移動距離
+        (self.step_count, phase_bits, self.w, self.x, self.y, self.z,
+         self.x_distance, self.y_distance,
+         self.z_distance) = _QUAT_DISTANCE.unpack_from(data, 2)
+        # 01ビットがenumの歩容フェイズ（0:なし, 1:立脚期, 2:遊脚期）
+        self.phase = phase_bits & 0b00000001
+        # 2,3,4ビットがenumの歩容ピリオド（0:なし,1:LoadingResponse, 2:MidStance, 3:TerminalStance, 4:InitialSwing, 5:MidSwing, 6:TerminalSwing）
+        self.period = (phase_bits & 0b00011110) >> 1
+        # 5,6,7ビットがenumの歩容イベント(0:なし, 1:InitialContact, 2:FootFlat, 3:HeelRise, 4:ToeOff, 5:FeetAdjacent, 6:TibiaVertical)
+        self.event = (phase_bits & 0b11100000) >> 5
 
     def print(self):
         print(f"Step count: {self.step_count}")
@@ -341,47 +425,163 @@ class StepAnalysisData:
             data: 生データ
         """
         self.data = data
+        self.step_count = _U16BE.unpack_from(data, 2)[0]
 
-        # gait overview
-        if data[1] == 0:
-            self.step_count = int.from_bytes(
-                data[2:4], byteorder='big', signed=False)
-            if self.step_count > owner.step_count.gait:
-                self.gait = GaitData(data)
-                # コールバック関数が設定されている場合、コールバック関数を呼び出す
-                if hasattr(owner, 'got_gait_callback') and owner.got_gait_callback:
-                    owner.got_gait_callback(self.gait)
-            owner.step_count.gait = self.step_count
-        # stride
-        elif data[1] == 1:
-            self.step_count = int.from_bytes(
-                data[2:4], byteorder='big', signed=False)
-            if self.step_count > owner.step_count.stride:
-                self.stride = StrideData(data)
-                # コールバック関数が設定されている場合、コールバック関数を呼び出す
-                if hasattr(owner, 'got_stride_callback') and owner.got_stride_callback:
-                    owner.got_stride_callback(self.stride)
-            owner.step_count.stride = self.step_count
-        # pronation
-        elif data[1] == 2:
-            self.step_count = int.from_bytes(
-                data[2:4], byteorder='big', signed=False)
-            if self.step_count > owner.step_count.pronation:
-                self.pronation = PronationData(data)
-                # コールバック関数が設定されている場合、コールバック関数を呼び出す
-                if hasattr(owner, 'got_pronation_callback') and owner.got_pronation_callback:
-                    owner.got_pronation_callback(self.pronation)
-            owner.step_count.pronation = self.step_count
-        # quaternion
-        elif data[1] == 4:
-            self.step_count = int.from_bytes(
-                data[2:4], byteorder='big', signed=False)
-            # if self.step_count > owner.step_count.quat:
-            self.quat_distance = QuatDistanceData(data)
-            # コールバック関数が設定されている場合、コールバック関数を呼び出す
-            if hasattr(owner, 'got_quat_distance_callback') and owner.got_quat_distance_callback:
-                owner.got_quat_distance_callback(self.quat_distance)
-            owner.step_count.quat = self.step_count
+        handler = _STEP_ANALYSIS_HANDLERS.get(data[1])
+        if handler is not None:
+            handler(self, owner, data)
+
+
+def _handle_gait(analysis, owner, data):
+    """
+    Gait Overview（サブヘッダ0）を処理する
+    """
+    if analysis.step_count > owner.step_count.gait:
+        analysis.gait = GaitData(data)
+        # コールバック関数が設定されている場合、コールバック関数を呼び出す
+        if owner.got_gait_callback is not None:
+            owner.got_gait_callback(analysis.gait)
+    owner.step_count.gait = analysis.step_count
+
+
+def _handle_stride(analysis, owner, data):
+    """
+    Stride（サブヘッダ1）を処理する
+    """
+    if analysis.step_count > owner.step_count.stride:
+        analysis.stride = StrideData(data)
+        # コールバック関数が設定されている場合、コールバック関数を呼び出す
+        if owner.got_stride_callback is not None:
+            owner.got_stride_callback(analysis.stride)
+    owner.step_count.stride = analysis.step_count
+
+
+def _handle_pronation(analysis, owner, data):
+    """
+    Pronation（サブヘッダ2）を処理する
+    """
+    if analysis.step_count > owner.step_count.pronation:
+        analysis.pronation = PronationData(data)
+        # コールバック関数が設定されている場合、コールバック関数を呼び出す
+        if owner.got_pronation_callback is not None:
+            owner.got_pronation_callback(analysis.pronation)
+    owner.step_count.pronation = analysis.step_count
+
+
+def _handle_quat_distance(analysis, owner, data):
+    """
+    クオータニオン（サブヘッダ4）を処理する。歩数による重複判定は行わない
+    """
+    analysis.quat_distance = QuatDistanceData(data)
+    # コールバック関数が設定されている場合、コールバック関数を呼び出す
+    if owner.got_quat_distance_callback is not None:
+        owner.got_quat_distance_callback(analysis.quat_distance)
+    owner.step_count.quat = analysis.step_count
+
+
+# サブヘッダ(data[1])ごとのステップ解析の処理
+_STEP_ANALYSIS_HANDLERS = {
+    0: _handle_gait,
+    1: _handle_stride,
+    2: _handle_pronation,
+    4: _handle_quat_distance,
+}
+
+
+def _parse_header(data):
+    """
+    センサ値パケットのヘッダ（タイプ、シリアルナンバー、タイムスタンプ）を読み出す
+
+    Returns:
+        (type, serial_number, timestamp) のタプル
+    """
+    type_, serial_number, hours, minutes, seconds, milliseconds = \
+        _SENSOR_HEADER.unpack_from(data, 0)
+    return type_, serial_number, _clock_to_timestamp(
+        hours, minutes, seconds, milliseconds)
+
+
+def _decode_50(data):
+    """
+    type=50（クオータニオン、ジャイロ、加速度）のセンサ値パケットをデコードする
+
+    Returns:
+        サブパケットごとの (w, x, y, z, gx, gy, gz, ax, ay, az, dt) をpacket_number順に並べたリストと、
+        各サブパケットの前のサブパケットからの経過時間[ms]のリスト
+    """
+    # サブパケットはpacket_numberの逆順に格納されている
+    rows = list(_S50.iter_unpack(data[8:8+_S50.size*4]))[::-1]
+    return rows, [0] + [row[10] for row in rows[1:]]
+
+
+def _decode_55(data):
+    """
+    type=55（ジャイロ、加速度、圧力）のセンサ値パケットをデコードする
+
+    Returns:
+        サブパケットごとの (gx, gy, gz, ax, ay, az, p0..p5) をpacket_number順に並べたリストと、
+        各サブパケットの前のサブパケットからの経過時間[ms]のリスト
+    """
+    rows = list(_S55.iter_unpack(data[8:8+_S55.size*4]))[::-1]
+    # 経過時間はdata[28+24*i]（iはサブパケットの格納位置）を使う
+    return rows, [0] + [data[28+24*(3-n)] for n in range(1, 4)]
+
+
+def _decode_56(data):
+    """
+    type=56（クオータニオン、ジャイロ、加速度、圧力）のセンサ値パケットをデコードする
+
+    Returns:
+        サブパケットごとの (w, x, y, z, gx, gy, gz, ax, ay, az, p0..p5) をpacket_number順に並べたリストと、
+        各サブパケットの前のサブパケットからの経過時間[ms]のリスト（全サブパケットが同じタイムスタンプ）
+    """
+    rows = list(_S56.iter_unpack(data[8:8+_S56.size*2]))[::-1]
+    return rows, [0, 0]
+
+
+# タイプ(data[0])ごとのデコード関数と、デコード結果の中の
+# クオータニオン、ジャイロ、加速度、圧力の位置（含まれない場合はNone）
+_SENSOR_LAYOUTS = {
+    50: (_decode_50, slice(0, 4), slice(4, 7), slice(7, 10), None),
+    55: (_decode_55, None, slice(0, 3), slice(3, 6), slice(6, 12)),
+    56: (_decode_56, slice(0, 4), slice(4, 7), slice(7, 10), slice(10, 16)),
+}
+
+
+def _call_batch_callbacks(owner, rows, sensor_range, acc, gyro, quat=None, pressure=None):
+    """
+    1回の通知に含まれるサブパケットの値をまとめてバッチコールバック関数に渡す。
+    サブパケットごとのAccData等のオブジェクトは生成しない
+
+    Args:
+        owner: オーナー（Orpheクラスのインスタンス）
+        rows: デコード済みのサブパケットのリスト（packet_number順）
+        sensor_range: 加速度センサとジャイロセンサのレンジ。Rangeクラスのインスタンス
+        acc: rowsの中の加速度(x,y,z)の位置を示すslice
+        gyro: rowsの中のジャイロ(x,y,z)の位置を示すslice
+        quat: rowsの中のクオータニオン(w,x,y,z)の位置を示すslice。含まれない場合はNone
+        pressure: rowsの中の圧力(6ch)の位置を示すslice。含まれない場合はNone
+    """
+    callback = owner.got_acc_batch_callback
+    if callback is not None:
+        callback([tuple(v * _RAW_SCALE for v in row[acc]) for row in rows])
+    callback = owner.got_converted_acc_batch_callback
+    if callback is not None:
+        acc_scale = _ACC_SCALES[sensor_range.acc]
+        callback([tuple(v * acc_scale for v in row[acc]) for row in rows])
+    callback = owner.got_gyro_batch_callback
+    if callback is not None:
+        callback([tuple(v * _RAW_SCALE for v in row[gyro]) for row in rows])
+    callback = owner.got_converted_gyro_batch_callback
+    if callback is not None:
+        gyro_scale = _GYRO_SCALES[sensor_range.gyro]
+        callback([tuple(v * gyro_scale for v in row[gyro]) for row in rows])
+    callback = owner.got_quat_batch_callback
+    if quat is not None and callback is not None:
+        callback([tuple(v * _RAW_SCALE for v in row[quat]) for row in rows])
+    callback = owner.got_pressure_batch_callback
+    if pressure is not None and callback is not None:
+        callback([row[pressure] for row in rows])
 
 
 class SensorValuesData:
@@ -399,6 +599,10 @@ class SensorValuesData:
         gyro: ジャイロセンサの値
         converted_gyro: 変換後のジャイロセンサの値
         quat: クォータニオンの値
+
+    acc, gyro, quat 等は対応するサブパケットごとのコールバック関数が設定されている場合のみ生成される。
+    バッチコールバック関数には1回の通知分の値がタプルのリストとしてまとめて渡される。
+    一括コールバック関数には1回の通知分の値オブジェクトがリストとしてまとめて渡される。
     """
 
     def __init__(self, owner, data, sensor_range):
@@ -410,281 +614,116 @@ class SensorValuesData:
             data: 生データ
             sensor_range: 加速度センサとジャイロセンサのレンジ。Rangeクラスのインスタンス
             """
-        if data[0] == 50:
-            self.data = data
-            self.type = int.from_bytes(
-                data[0:1], byteorder='big', signed=False)
-            self.serial_number = int.from_bytes(
-                data[1:3], byteorder='big', signed=False)
-            self.timestamp = to_timestamp(
-                data[3], data[4], data[5], data[6], data[7])
-            each_timestamp = self.timestamp
-
-            for i in range(3, -1, -1):
-                step = 21*i
-                self.acc = AccData()
-                self.acc.x = int.from_bytes(
-                    data[22+step:24+step], byteorder='big', signed=True) / 32768
-                self.acc.y = int.from_bytes(
-                    data[24+step:26+step], byteorder='big', signed=True) / 32768
-                self.acc.z = int.from_bytes(
-                    data[26+step:28+step], byteorder='big', signed=True) / 32768
-
-                self.converted_acc = AccData()
-                amp_acc = [2, 4, 8, 16][sensor_range.acc]
-                self.converted_acc.x = self.acc.x * amp_acc
-                self.converted_acc.y = self.acc.y * amp_acc
-                self.converted_acc.z = self.acc.z * amp_acc
-
-                self.gyro = GyroData()
-                self.gyro.x = int.from_bytes(
-                    data[16+step:18+step], byteorder='big', signed=True) / 32768
-                self.gyro.y = int.from_bytes(
-                    data[18+step:20+step], byteorder='big', signed=True) / 32768
-                self.gyro.z = int.from_bytes(
-                    data[20+step:22+step], byteorder='big', signed=True) / 32768
-
-                self.converted_gyro = GyroData()
-                amp_gyro = [250, 500, 1000, 2000][sensor_range.gyro]
-                self.converted_gyro.x = self.gyro.x * amp_gyro
-                self.converted_gyro.y = self.gyro.y * amp_gyro
-                self.converted_gyro.z = self.gyro.z * amp_gyro
-
-                self.quat = QuatData()
-                self.quat.w = int.from_bytes(
-                    data[8+step:10+step], byteorder='big', signed=True) / 32768
-                self.quat.x = int.from_bytes(
-                    data[10+step:12+step], byteorder='big', signed=True) / 32768
-                self.quat.y = int.from_bytes(
-                    data[12+step:14+step], byteorder='big', signed=True) / 32768
-                self.quat.z = int.from_bytes(
-                    data[14+step:16+step], byteorder='big', signed=True) / 32768
-
-                self.acc.serial_number = self.serial_number
-                self.converted_acc.serial_number = self.serial_number
-                self.gyro.serial_number = self.serial_number
-                self.converted_gyro.serial_number = self.serial_number
-                self.quat.serial_number = self.serial_number
-                self.acc.packet_number = 3-i
-                self.converted_acc.packet_number = 3-i
-                self.gyro.packet_number = 3-i
-                self.converted_gyro.packet_number = 3-i
-                self.quat.packet_number = 3-i
-
-                if i == 3:
-                    self.acc.timestamp = each_timestamp
-                    self.converted_acc.timestamp = each_timestamp
-                    self.gyro.timestamp = each_timestamp
-                    self.converted_gyro.timestamp = each_timestamp
-                    self.quat.timestamp = each_timestamp
-                else:
-                    each_timestamp = each_timestamp + data[28+step]
-                    self.acc.timestamp = each_timestamp
-                    self.converted_acc.timestamp = each_timestamp
-                    self.gyro.timestamp = each_timestamp
-                    self.converted_gyro.timestamp = each_timestamp
-                    self.quat.timestamp = each_timestamp
-
-                # コールバック関数が設定されている場合、コールバック関数を呼び出す
-                if hasattr(owner, 'got_acc_callback') and owner.got_acc_callback:
-                    owner.got_acc_callback(self.acc)
-                if hasattr(owner, 'got_converted_acc_callback') and owner.got_converted_acc_callback:
-                    owner.got_converted_acc_callback(self.converted_acc)
-                if hasattr(owner, 'got_gyro_callback') and owner.got_gyro_callback:
-                    owner.got_gyro_callback(self.gyro)
-                if hasattr(owner, 'got_converted_gyro_callback') and owner.got_converted_gyro_callback:
-                    owner.got_converted_gyro_callback(self.converted_gyro)
-                if hasattr(owner, 'got_quat_callback') and owner.got_quat_callback:
-                    owner.got_quat_callback(self.quat)
-
-        # 200Hz streaming gyro accel pressure
-        elif data[0] == 55:
-            self.data = data
-            self.type = int.from_bytes(
-                data[0:1], byteorder='big', signed=False)
-            self.serial_number = int.from_bytes(
-                data[1:3], byteorder='big', signed=False)
-            self.timestamp = to_timestamp(
-                data[3], data[4], data[5], data[6], data[7])
-            each_timestamp = self.timestamp
-
-            for i in range(3, -1, -1):
-                step = 24*i
-                self.acc = AccData()
-                self.acc.x = int.from_bytes(
-                    data[14+step:16+step], byteorder='big', signed=True) / 32768
-                self.acc.y = int.from_bytes(
-                    data[16+step:18+step], byteorder='big', signed=True) / 32768
-                self.acc.z = int.from_bytes(
-                    data[18+step:20+step], byteorder='big', signed=True) / 32768
-
-                self.converted_acc = AccData()
-                amp_acc = [2, 4, 8, 16][sensor_range.acc]
-                self.converted_acc.x = self.acc.x * amp_acc
-                self.converted_acc.y = self.acc.y * amp_acc
-                self.converted_acc.z = self.acc.z * amp_acc
-
-                self.gyro = GyroData()
-                self.gyro.x = int.from_bytes(
-                    data[8+step:10+step], byteorder='big', signed=True) / 32768
-                self.gyro.y = int.from_bytes(
-                    data[10+step:12+step], byteorder='big', signed=True) / 32768
-                self.gyro.z = int.from_bytes(
-                    data[12+step:14+step], byteorder='big', signed=True) / 32768
-
-                self.converted_gyro = GyroData()
-                amp_gyro = [250, 500, 1000, 2000][sensor_range.gyro]
-                self.converted_gyro.x = self.gyro.x * amp_gyro
-                self.converted_gyro.y = self.gyro.y * amp_gyro
-                self.converted_gyro.z = self.gyro.z * amp_gyro
-
-                # self.quat = QuatData()
-                # self.quat.w = int.from_bytes(
-                #     data[8+step:10+step], byteorder='big', signed=True) / 32768
-                # self.quat.x = int.from_bytes(
-                #     data[10+step:12+step], byteorder='big', signed=True) / 32768
-                # self.quat.y = int.from_bytes(
-                #     data[12+step:14+step], byteorder='big', signed=True) / 32768
-                # self.quat.z = int.from_bytes(
-                #     data[14+step:16+step], byteorder='big', signed=True) / 32768
-
-                self.pressure = PressureData()
-                for j in range(6):
-                    self.pressure.values.append(int.from_bytes(
-                        data[20+step+2*j:22+step+2*j], byteorder='big', signed=False))
-
-                self.acc.serial_number = self.serial_number
-                self.converted_acc.serial_number = self.serial_number
-                self.gyro.serial_number = self.serial_number
-                self.converted_gyro.serial_number = self.serial_number
-                # self.quat.serial_number = self.serial_number
-                self.pressure.serial_number = self.serial_number
-                self.acc.packet_number = 3-i
-                self.converted_acc.packet_number = 3-i
-                self.gyro.packet_number = 3-i
-                self.converted_gyro.packet_number = 3-i
-                # self.quat.packet_number = 3-i
-                self.pressure.packet_number = 3-i
-
-                if i == 3:
-                    self.acc.timestamp = each_timestamp
-                    self.converted_acc.timestamp = each_timestamp
-                    self.gyro.timestamp = each_timestamp
-                    self.converted_gyro.timestamp = each_timestamp
-                    # self.quat.timestamp = each_timestamp
-                    self.pressure.timestamp = each_timestamp
-                else:
-                    each_timestamp = each_timestamp + data[28+step]
-                    self.acc.timestamp = each_timestamp
-                    self.converted_acc.timestamp = each_timestamp
-                    self.gyro.timestamp = each_timestamp
-                    self.converted_gyro.timestamp = each_timestamp
-                    # self.quat.timestamp = each_timestamp
-                    self.pressure.timestamp = each_timestamp
-
-                # コールバック関数が設定されている場合、コールバック関数を呼び出す
-                if hasattr(owner, 'got_acc_callback') and owner.got_acc_callback:
-                    owner.got_acc_callback(self.acc)
-                if hasattr(owner, 'got_converted_acc_callback') and owner.got_converted_acc_callback:
-                    owner.got_converted_acc_callback(self.converted_acc)
-                if hasattr(owner, 'got_gyro_callback') and owner.got_gyro_callback:
-                    owner.got_gyro_callback(self.gyro)
-                if hasattr(owner, 'got_converted_gyro_callback') and owner.got_converted_gyro_callback:
-                    owner.got_converted_gyro_callback(self.converted_gyro)
-                if hasattr(owner, 'got_pressure_callback') and owner.got_pressure_callback:
-                    owner.got_pressure_callback(self.pressure)
-                # if hasattr(owner, 'got_quat_callback') and owner.got_quat_callback:
-                #     owner.got_quat_callback(self.quat)
-         # 100Hz streaming gyro accel pressure quaternion
-        # 100Hz streaming gyro accel pressure quaternion
-        elif data[0] == 56:
-            self.data = data
-            self.type = int.from_bytes(
-                data[0:1], byteorder='big', signed=False)
-            self.serial_number = int.from_bytes(
-                data[1:3], byteorder='big', signed=False)
-            self.timestamp = to_timestamp(
-                data[3], data[4], data[5], data[6], data[7])
-            each_timestamp = self.timestamp
-
-            for i in range(1, -1, -1):
-                step = 32*i
-                self.acc = AccData()
-                self.acc.x = int.from_bytes(
-                    data[22+step:24+step], byteorder='big', signed=True) / 32768
-                self.acc.y = int.from_bytes(
-                    data[24+step:26+step], byteorder='big', signed=True) / 32768
-                self.acc.z = int.from_bytes(
-                    data[26+step:28+step], byteorder='big', signed=True) / 32768
-
-                self.converted_acc = AccData()
-                amp_acc = [2, 4, 8, 16][sensor_range.acc]
-                self.converted_acc.x = self.acc.x * amp_acc
-                self.converted_acc.y = self.acc.y * amp_acc
-                self.converted_acc.z = self.acc.z * amp_acc
-
-                self.gyro = GyroData()
-                self.gyro.x = int.from_bytes(
-                    data[16+step:18+step], byteorder='big', signed=True) / 32768
-                self.gyro.y = int.from_bytes(
-                    data[18+step:20+step], byteorder='big', signed=True) / 32768
-                self.gyro.z = int.from_bytes(
-                    data[20+step:22+step], byteorder='big', signed=True) / 32768
-
-                self.converted_gyro = GyroData()
-                amp_gyro = [250, 500, 1000, 2000][sensor_range.gyro]
-                self.converted_gyro.x = self.gyro.x * amp_gyro
-                self.converted_gyro.y = self.gyro.y * amp_gyro
-                self.converted_gyro.z = self.gyro.z * amp_gyro
-
-                self.quat = QuatData()
-                self.quat.w = int.from_bytes(
-                    data[8+step:10+step], byteorder='big', signed=True) / 32768
-                self.quat.x = int.from_bytes(
-                    data[10+step:12+step], byteorder='big', signed=True) / 32768
-                self.quat.y = int.from_bytes(
-                    data[12+step:14+step], byteorder='big', signed=True) / 32768
-                self.quat.z = int.from_bytes(
-                    data[14+step:16+step], byteorder='big', signed=True) / 32768
-
-                self.pressure = PressureData()
-                for j in range(6):
-                    self.pressure.values.append(int.from_bytes(
-                        data[28+step+2*j:30+step+2*j], byteorder='big', signed=False))
-
-                self.acc.serial_number = self.serial_number
-                self.converted_acc.serial_number = self.serial_number
-                self.gyro.serial_number = self.serial_number
-                self.converted_gyro.serial_number = self.serial_number
-                self.quat.serial_number = self.serial_number
-                self.pressure.serial_number = self.serial_number
-                self.acc.packet_number = 1-i
-                self.converted_acc.packet_number = 1-i
-                self.gyro.packet_number = 1-i
-                self.converted_gyro.packet_number = 1-i
-                self.quat.packet_number = 1-i
-                self.pressure.packet_number = 1-i
-
-                self.acc.timestamp = each_timestamp
-                self.converted_acc.timestamp = each_timestamp
-                self.gyro.timestamp = each_timestamp
-                self.converted_gyro.timestamp = each_timestamp
-                self.quat.timestamp = each_timestamp
-                self.pressure.timestamp = each_timestamp
-
-                # コールバック関数が設定されている場合、コールバック関数を呼び出す
-                if hasattr(owner, 'got_acc_callback') and owner.got_acc_callback:
-                    owner.got_acc_callback(self.acc)
-                if hasattr(owner, 'got_converted_acc_callback') and owner.got_converted_acc_callback:
-                    owner.got_converted_acc_callback(self.converted_acc)
-                if hasattr(owner, 'got_gyro_callback') and owner.got_gyro_callback:
-                    owner.got_gyro_callback(self.gyro)
-                if hasattr(owner, 'got_converted_gyro_callback') and owner.got_converted_gyro_callback:
-                    owner.got_converted_gyro_callback(self.converted_gyro)
-                if hasattr(owner, 'got_pressure_callback') and owner.got_pressure_callback:
-                    owner.got_pressure_callback(self.pressure)
-                if hasattr(owner, 'got_quat_callback') and owner.got_quat_callback:
-                    owner.got_quat_callback(self.quat)
+        self.data = data
+        layout = _SENSOR_LAYOUTS.get(data[0])
+        if layout is None:
+            return
+        decode, quat, gyro, acc, pressure = layout
+
+        # 以降の読み出しはmemoryview経由で行い、スライスによるbytesのコピーを作らない
+        mv = data if isinstance(data, memoryview) else memoryview(data)
+        self.type, self.serial_number, self.timestamp = _parse_header(mv)
+        rows, dts = decode(mv)
+
+        _call_batch_callbacks(owner, rows, sensor_range, acc=acc, gyro=gyro,
+                              quat=quat, pressure=pressure)
+        acc_callback = owner.got_acc_callback
+        converted_acc_callback = owner.got_converted_acc_callback
+        gyro_callback = owner.got_gyro_callback
+        converted_gyro_callback = owner.got_converted_gyro_callback
+        quat_callback = owner.got_quat_callback if quat is not None else None
+        pressure_callback = owner.got_pressure_callback if pressure is not None else None
+        # 一括コールバック関数が設定されている場合は1回の通知分の値オブジェクトをリストに集める
+        accs = [] if owner.got_acc_bulk_callback is not None else None
+        converted_accs = [] if owner.got_converted_acc_bulk_callback is not None else None
+        gyros = [] if owner.got_gyro_bulk_callback is not None else None
+        converted_gyros = [] if owner.got_converted_gyro_bulk_callback is not None else None
+        quats = [] if quat is not None and owner.got_quat_bulk_callback is not None else None
+        pressures = [] if pressure is not None and owner.got_pressure_bulk_callback is not None else None
+
+        # 値オブジェクトはコールバック関数が設定されているものだけ生成する
+        want_acc = acc_callback is not None or accs is not None
+        want_converted_acc = converted_acc_callback is not None or converted_accs is not None
+        want_gyro = gyro_callback is not None or gyros is not None
+        want_converted_gyro = converted_gyro_callback is not None or converted_gyros is not None
+        want_quat = quat_callback is not None or quats is not None
+        want_pressure = pressure_callback is not None or pressures is not None
+        # 値オブジェクトを受け取るコールバック関数が無ければオブジェクトは生成しない
+        if not (want_acc or want_converted_acc or want_gyro
+                or want_converted_gyro or want_quat or want_pressure):
+            return
+
+        acc_scale = _ACC_SCALES[sensor_range.acc]
+        gyro_scale = _GYRO_SCALES[sensor_range.gyro]
+
+        each_timestamp = self.timestamp
+        for packet_number, (row, dt) in enumerate(zip(rows, dts)):
+            each_timestamp = each_timestamp + dt
+            stamp = (each_timestamp, self.serial_number, packet_number)
+
+            if want_acc or want_converted_acc:
+                a_x, a_y, a_z = row[acc]
+                if want_acc:
+                    self.acc = AccData(a_x * _RAW_SCALE, a_y * _RAW_SCALE,
+                                       a_z * _RAW_SCALE, *stamp)
+                    if acc_callback is not None:
+                        acc_callback(self.acc)
+                    if accs is not None:
+                        accs.append(self.acc)
+                if want_converted_acc:
+                    self.converted_acc = AccData(a_x * acc_scale,
+                                                 a_y * acc_scale,
+                                                 a_z * acc_scale, *stamp)
+                    if converted_acc_callback is not None:
+                        converted_acc_callback(self.converted_acc)
+                    if converted_accs is not None:
+                        converted_accs.append(self.converted_acc)
+            if want_gyro or want_converted_gyro:
+                g_x, g_y, g_z = row[gyro]
+                if want_gyro:
+                    self.gyro = GyroData(g_x * _RAW_SCALE, g_y * _RAW_SCALE,
+                                         g_z * _RAW_SCALE, *stamp)
+                    if gyro_callback is not None:
+                        gyro_callback(self.gyro)
+                    if gyros is not None:
+                        gyros.append(self.gyro)
+                if want_converted_gyro:
+                    self.converted_gyro = GyroData(g_x * gyro_scale,
+                                                   g_y * gyro_scale,
+                                                   g_z * gyro_scale, *stamp)
+                    if converted_gyro_callback is not None:
+                        converted_gyro_callback(self.converted_gyro)
+                    if converted_gyros is not None:
+                        converted_gyros.append(self.converted_gyro)
+            if want_pressure:
+                self.pressure = PressureData(row[pressure], *stamp)
+                if pressure_callback is not None:
+                    pressure_callback(self.pressure)
+                if pressures is not None:
+                    pressures.append(self.pressure)
+            if want_quat:
+                q_w, q_x, q_y, q_z = row[quat]
+                self.quat = QuatData(q_w * _RAW_SCALE, q_x * _RAW_SCALE,
+                                     q_y * _RAW_SCALE, q_z * _RAW_SCALE,
+                                     *stamp)
+                if quat_callback is not None:
+                    quat_callback(self.quat)
+                if quats is not None:
+                    quats.append(self.quat)
+
+        # 一括コールバック関数を呼び出す
+        if accs is not None:
+            owner.got_acc_bulk_callback(accs)
+        if converted_accs is not None:
+            owner.got_converted_acc_bulk_callback(converted_accs)
+        if gyros is not None:
+            owner.got_gyro_bulk_callback(gyros)
+        if converted_gyros is not None:
+            owner.got_converted_gyro_bulk_callback(converted_gyros)
+        if pressures is not None:
+            owner.got_pressure_bulk_callback(pressures)
+        if quats is not None:
+            owner.got_quat_bulk_callback(quats)
 
 
 class DeviceInformation:
@@ -706,16 +745,12 @@ class DeviceInformation:
 
     def __init__(self, data):
         self.data = data
-        self.battery = int.from_bytes(data[0:1], byteorder='big', signed=False)
-        self.mount_position = int.from_bytes(
-            data[1:2], byteorder='big', signed=False)
+        self.battery = data[0]
+        self.mount_position = data[1]
         self.range = Range()
-        self.range.acc = int.from_bytes(
-            data[8:9], byteorder='big', signed=False)
-        self.range.gyro = int.from_bytes(
-            data[9:10], byteorder='big', signed=False)
-        self.version = int.from_bytes(
-            data[18:19], byteorder='big', signed=False)
+        self.range.acc = data[8]
+        self.range.gyro = data[9]
+        self.version = data[18]
         self.device_information = None
 
 
@@ -723,6 +758,8 @@ class StepCount:
     """
     歩数を格納するクラス"""
 
+    __slots__ = ('gait', 'stride', 'pronation', 'quat')
+
     def __init__(self):
         self.gait = 0
         self.stride = 0
@@ -740,9 +777,49 @@ class Orphe:
         """
         コンストラクタ
         """
-        self.serial_number_prev = 0
+        self.serial_number_prev = None  # 直前に受信したパケットのシリアルナンバー（未受信の場合はNone）
         self.client = None
+        self.device_information = None  # 最後に読み書きしたデバイス情報（未取得の場合はNone）
         self.step_count = StepCount()  # 歩数
+        # 読み書き・通知に使うキャラクタリスティック（接続時に解決したBleakGATTCharacteristicに置き換える）
+        self._device_information_char = CHARACTERISTIC_DEVICE_INFORMATION_UUID
+        self._sensor_values_char = CHARACTERISTIC_SENSOR_VALUES_UUID
+        self._step_analysis_char = CHARACTERISTIC_STEP_ANALYSIS_UUID
+        # BLEの通知ハンドラから解析タスクへセンサ値を渡すキューとその解析タスク
+        self._sensor_values_queue = None
+        self._sensor_values_task = None
+        self.dropped_count = 0  # キューが溢れて破棄したパケット数
+        # デバイス情報書き込み用のバッファ（固定値以外は書き込み時に上書きする）
+        self._di_buf = bytearray([
+            0x09, 0x00, 0x00, 0x00, 0x01, 0x00, 0x3C, 0x00, 0x00, 0x00,
+            0x00, 0x00, 0xFF, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+        ])
+
+        # コールバック関数（未設定の場合はNone）
+        self.lost_data_callback = None
+        self.got_pressure_callback = None
+        self.got_acc_callback = None
+        self.got_gyro_callback = None
+        self.got_converted_acc_callback = None
+        self.got_converted_gyro_callback = None
+        self.got_quat_callback = None
+        self.got_acc_batch_callback = None
+        self.got_converted_acc_batch_callback = None
+        self.got_gyro_batch_callback = None
+        self.got_converted_gyro_batch_callback = None
+        self.got_quat_batch_callback = None
+        self.got_pressure_batch_callback = None
+        self.got_acc_bulk_callback = None
+        self.got_converted_acc_bulk_callback = None
+        self.got_gyro_bulk_callback = None
+        self.got_converted_gyro_bulk_callback = None
+        self.got_quat_bulk_callback = None
+        self.got_pressure_bulk_callback = None
+        self.got_gait_callback = None
+        self.got_stride_callback = None
+        self.got_pronation_callback = None
+        self.got_quat_distance_callback = None
+        self.on_disconnect_callback = None
 
     def set_lost_data_callback(self, callback):
         """
@@ -793,6 +870,126 @@ class Orphe:
         """
         self.got_quat_callback = callback
 
+    def set_got_acc_batch_callback(self, callback):
+        """
+        加速度センサの値を1回の通知ごとに(x, y, z)タプルのリストで受け取るコールバック関数を設定する
+
+        コールバック関数には(x, y, z)タプルのリストがpacket_number順に渡されます。
+        AccDataオブジェクトを生成しないため軽量です。値だけを使う場合（グラフの描画など）はこちらを、
+        タイムスタンプやシリアルナンバーも必要な場合はset_got_acc_bulk_callbackを使ってください。
+        """
+        self.got_acc_batch_callback = callback
+
+    def set_got_converted_acc_batch_callback(self, callback):
+        """
+        加速度レンジで変換した加速度センサの値を1回の通知ごとに(x, y, z)タプルのリストで受け取るコールバック関数を設定する
+
+        コールバック関数には(x, y, z)タプルのリストがpacket_number順に渡されます。
+        AccDataオブジェクトを生成しないため軽量です。値だけを使う場合（グラフの描画など）はこちらを、
+        タイムスタンプやシリアルナンバーも必要な場合はset_got_converted_acc_bulk_callbackを使ってください。
+        """
+        self.got_converted_acc_batch_callback = callback
+
+    def set_got_gyro_batch_callback(self, callback):
+        """
+        ジャイロセンサの値を1回の通知ごとに(x, y, z)タプルのリストで受け取るコールバック関数を設定する
+
+        コールバック関数には(x, y, z)タプルのリストがpacket_number順に渡されます。
+        GyroDataオブジェクトを生成しないため軽量です。値だけを使う場合（グラフの描画など）はこちらを、
+        タイムスタンプやシリアルナンバーも必要な場合はset_got_gyro_bulk_callbackを使ってください。
+        """
+        self.got_gyro_batch_callback = callback
+
+    def set_got_converted_gyro_batch_callback(self, callback):
+        """
+        ジャイロレンジで変換したジャイロセンサの値を1回の通知ごとに(x, y, z)タプルのリストで受け取るコールバック関数を設定する
+
+        コールバック関数には(x, y, z)タプルのリストがpacket_number順に渡されます。
+        GyroDataオブジェクトを生成しないため軽量です。値だけを使う場合（グラフの描画など）はこちらを、
+        タイムスタンプやシリアルナンバーも必要な場合はset_got_converted_gyro_bulk_callbackを使ってください。
+        """
+        self.got_converted_gyro_batch_callback = callback
+
+    def set_got_quat_batch_callback(self, callback):
+        """
+        クォータニオンの値を1回の通知ごとに(w, x, y, z)タプルのリストで受け取るコールバック関数を設定する
+
+        コールバック関数には(w, x, y, z)タプルのリストがpacket_number順に渡されます。
+        QuatDataオブジェクトを生成しないため軽量です。値だけを使う場合（グラフの描画など）はこちらを、
+        タイムスタンプやシリアルナンバーも必要な場合はset_got_quat_bulk_callbackを使ってください。
+        """
+        self.got_quat_batch_callback = callback
+
+    def set_got_pressure_batch_callback(self, callback):
+        """
+        圧力センサの値を1回の通知ごとに6ch分の圧力値のタプルのリストで受け取るコールバック関数を設定する
+
+        コールバック関数には6ch分の圧力値のタプルのリストがpacket_number順に渡されます。
+        PressureDataオブジェクトを生成しないため軽量です。値だけを使う場合（グラフの描画など）はこちらを、
+        タイムスタンプやシリアルナンバーも必要な場合はset_got_pressure_bulk_callbackを使ってください。
+        """
+        self.got_pressure_batch_callback = callback
+
+    def set_got_acc_bulk_callback(self, callback):
+        """
+        加速度センサの値を1回の通知ごとにAccDataのリストで受け取るコールバック関数を設定する
+
+        コールバック関数にはAccDataのリストがpacket_number順に渡されます。
+        タイムスタンプやシリアルナンバーも含めて1回の通知分をまとめて処理したい場合はこちらを、
+        値だけでよい場合はより軽量なset_got_acc_batch_callbackを使ってください。
+        """
+        self.got_acc_bulk_callback = callback
+
+    def set_got_converted_acc_bulk_callback(self, callback):
+        """
+        加速度レンジで変換した加速度センサの値を1回の通知ごとにAccDataのリストで受け取るコールバック関数を設定する
+
+        コールバック関数にはAccDataのリストがpacket_number順に渡されます。
+        タイムスタンプやシリアルナンバーも含めて1回の通知分をまとめて処理したい場合はこちらを、
+        値だけでよい場合はより軽量なset_got_converted_acc_batch_callbackを使ってください。
+        """
+        self.got_converted_acc_bulk_callback = callback
+
+    def set_got_gyro_bulk_callback(self, callback):
+        """
+        ジャイロセンサの値を1回の通知ごとにGyroDataのリストで受け取るコールバック関数を設定する
+
+        コールバック関数にはGyroDataのリストがpacket_number順に渡されます。
+        タイムスタンプやシリアルナンバーも含めて1回の通知分をまとめて処理したい場合はこちらを、
+        値だけでよい場合はより軽量なset_got_gyro_batch_callbackを使ってください。
+        """
+        self.got_gyro_bulk_callback = callback
+
+    def set_got_converted_gyro_bulk_callback(self, callback):
+        """
+        ジャイロレンジで変換したジャイロセンサの値を1回の通知ごとにGyroDataのリストで受け取るコールバック関数を設定する
+
+        コールバック関数にはGyroDataのリストがpacket_number順に渡されます。
+        タイムスタンプやシリアルナンバーも含めて1回の通知分をまとめて処理したい場合はこちらを、
+        値だけでよい場合はより軽量なset_got_converted_gyro_batch_callbackを使ってください。
+        """
+        self.got_converted_gyro_bulk_callback = callback
+
+    def set_got_quat_bulk_callback(self, callback):
+        """
+        クォータニオンの値を1回の通知ごとにQuatDataのリストで受け取るコールバック関数を設定する
+
+        コールバック関数にはQuatDataのリストがpacket_number順に渡されます。
+        タイムスタンプやシリアルナンバーも含めて1回の通知分をまとめて処理したい場合はこちらを、
+        値だけでよい場合はより軽量なset_got_quat_batch_callbackを使ってください。
+        """
+        self.got_quat_bulk_callback = callback
+
+    def set_got_pressure_bulk_callback(self, callback):
+        """
+        圧力センサの値を1回の通知ごとにPressureDataのリストで受け取るコールバック関数を設定する
+
+        コールバック関数にはPressureDataのリストがpacket_number順に渡されます。
+        タイムスタンプやシリアルナンバーも含めて1回の通知分をまとめて処理したい場合はこちらを、
+        値だけでよい場合はより軽量なset_got_pressure_batch_callbackを使ってください。
+        """
+        self.got_pressure_bulk_callback = callback
+
     def set_got_gait_callback(self, callback):
         """
         歩行解析の値を取得したときに呼び出されるコールバック関数を設定する
@@ -834,65 +1031,91 @@ class Orphe:
         devices = await BleakScanner.discover(return_adv=True)
         return devices
 
-    async def connect(self, address=None):
+    async def connect(self, address=None, passive=False):
         """
         ORPHE COREと接続する
 
         Args:
             address: 接続するデバイスのアドレス。指定しない場合はスキャンしてSERVICE UUIDで合致するものに接続する
+            passive: Trueの場合、Linux(BlueZ)ではデバイス名が "INS" で始まるアドバタイズだけをBlueZ側でフィルタするパッシブスキャンを行う。
+                addressを指定した場合も同じフィルタでスキャンするため、名前が "INS" で始まらないデバイスは見つからない。
+                BlueZの実験的機能（bluetoothd --experimental）が有効になっている必要がある。Linux以外では無視される
         Returns:
             接続に成功した場合はTrue、失敗した場合はFalse
         """
         print(
             f"Scanning for ORPHE CORE BLE device...[address specified: {address}]")
-        devices = await BleakScanner.discover(return_adv=True)
-
-        target_device = None
 
+        # 見つかった時点でスキャンを終了する
         if address is not None:
-            for addr, (device, adv_data) in devices.items():
-                if device.address == address:
-                    target_device = device
-                    print(
-                        f"Found target device: {device.name}(name), {device.address}(address)")
-                    break
+            target_device = await BleakScanner.find_device_by_address(
+                address, timeout=SCAN_TIMEOUT_SEC, **self._scanner_kwargs(passive))
         else:
-            for addr, (device, adv_data) in devices.items():
-                #  device.name に INS* が含まれている場合に接続する
-                if device.name is not None and "INS" in device.name:
-                    target_device = device
-                    print(
-                        f"Found target device: {device.name}(name), {device.address}(address)")
-                    break
+            #  device.name に INS* が含まれている場合に接続する
+            target_device = await BleakScanner.find_device_by_filter(
+                lambda device, adv_data: device.name is not None and "INS" in device.name,
+                timeout=SCAN_TIMEOUT_SEC, **self._scanner_kwargs(passive))
 
         if target_device is None:
             print("Target device not found.")
             return False
+        print(
+            f"Found target device: {target_device.name}(name), {target_device.address}(address)")
+
+        # 以前の接続で取得したデバイス情報は使わない
+        self.device_information = None
 
-        self.client = BleakClient(target_device.address)
+        # BLEDeviceを渡すことで接続時の再スキャンを避ける
+        # 切断はBleakからの通知で検知する（定期的なポーリングはしない）
+        self.client = BleakClient(
+            target_device, disconnected_callback=self._on_bleak_disconnect)
         await self.client.connect()
         if self.client.is_connected:
             print("Connected to the device")
-
-            # 別のタスクで接続状態を監視
-            asyncio.create_task(self.monitor_connection(self.client))
-
+            self._resolve_characteristics()
             return True
         else:
             print("Failed to connect to the device")
             return False
 
-    async def monitor_connection(self, client):
-        while True:
-            await asyncio.sleep(1)  # 1秒ごとに接続状態をチェック
-            if not client.is_connected:
-                await self.disconnect_callback(self)
-                break
-
-    async def disconnect_callback(self, owner):
-        # コールバック関数が設定されている場合、コールバック関数を呼び出す
-        if hasattr(owner, 'on_disconnect_callback') and owner.on_disconnect_callback:
-            owner.on_disconnect_callback()
+    def _scanner_kwargs(self, passive):
+        """
+        connect()のスキャンでBleakScannerに渡す追加の引数を返す
+        """
+        if not passive or not sys.platform.startswith("linux"):
+            return {}
+        from bleak.assigned_numbers import AdvertisementDataType
+        from bleak.backends.bluezdbus.advertisement_monitor import OrPattern
+        from bleak.backends.bluezdbus.scanner import BlueZScannerArgs
+
+        # デバイス名の先頭が "INS" のアドバタイズだけをBlueZから受け取る
+        or_patterns = [
+            OrPattern(0, AdvertisementDataType.COMPLETE_LOCAL_NAME, b"INS"),
+            OrPattern(0, AdvertisementDataType.SHORTENED_LOCAL_NAME, b"INS"),
+        ]
+        return {
+            "scanning_mode": "passive",
+            "bluez": BlueZScannerArgs(or_patterns=or_patterns),
+        }
+
+    def _resolve_characteristics(self):
+        """
+        キャラクタリスティックをUUIDから一度だけ解決しておき、読み書きのたびにUUIDを検索しないようにする。
+        見つからない場合はUUIDのまま使う
+        """
+        services = self.client.services
+        self._device_information_char = services.get_characteristic(
+            CHARACTERISTIC_DEVICE_INFORMATION_UUID) or CHARACTERISTIC_DEVICE_INFORMATION_UUID
+        self._sensor_values_char = services.get_characteristic(
+            CHARACTERISTIC_SENSOR_VALUES_UUID) or CHARACTERISTIC_SENSOR_VALUES_UUID
+        self._step_analysis_char = services.get_characteristic(
+            CHARACTERISTIC_STEP_ANALYSIS_UUID) or CHARACTERISTIC_STEP_ANALYSIS_UUID
+
+    def _on_bleak_disconnect(self, client):
+        # 切断時にBleakから呼び出される。コールバック関数が設定されている場合、コールバック関数を呼び出す
+        self._stop_sensor_values_task()
+        if self.on_disconnect_callback is not None:
+            self.on_disconnect_callback()
 
     def is_connected(self):
         """
@@ -910,7 +1133,7 @@ class Orphe:
         ORPHE COREのデバイス情報を取得する。一度取得したデバイス情報はself.device_informationメンバ変数に保存される。
         Returns: DeviceInformationクラスのインスタンス
         """
-        di = await self.client.read_gatt_char(CHARACTERISTIC_DEVICE_INFORMATION_UUID)
+        di = await self.client.read_gatt_char(self._device_information_char)
         di = DeviceInformation(di)
         self.device_information = di  # デバイス情報をメンバ変数として保存（更新）しておく
         return di
@@ -932,33 +1155,59 @@ class Orphe:
         mount_position(int): 0 or 1
         Returns: None
         """
-        # mount_positionの値の範囲をチェック
-        if mount_position < 0 or mount_position > 3:
+        await self.configure(mount_position=mount_position)
+
+    async def configure(self, mount_position=None, acc_range=None, gyro_range=None):
+        """
+        取り付け位置と加速度・ジャイロのレンジをまとめて設定する。
+        デバイス情報の読み込みと書き込みは1回ずつで済むため、複数の設定を変更する場合は個別のsetterを呼ぶより速い。
+        Noneを指定した項目は変更しない。いずれかの値が不正な場合は何も書き込まない
+
+        Args:
+            mount_position(int): 0, 1, 2, 3
+            acc_range(int): 2, 4, 8, 16[g]
+            gyro_range(int): 250, 500, 1000, 2000[deg/s]
+        Returns: None
+        """
+        # 値の範囲をチェック
+        if mount_position is not None and (mount_position < 0 or mount_position > 3):
             print("mount_position must be 0, 1, 2, 3.")
             return
+        if acc_range is not None and acc_range not in _ACC_MAP:
+            print("acc_range must be 2, 4, 8, or 16[g].")
+            return
+        if gyro_range is not None and gyro_range not in _GYRO_MAP:
+            print("gyro_range must be 250, 500, 1000, or 2000[deg/s].")
+            return
+        if mount_position is None and acc_range is None and gyro_range is None:
+            return
 
-        di = await self.read_device_information()
-        di.mount_position = mount_position
+        # デバイス情報を読み込む（取得済みの場合は読み込まずにそれを使う）
+        di = self.device_information or await self.read_device_information()
+
+        # デバイス情報を変更（レンジは 0,1,2,3 に変換）
+        if mount_position is not None:
+            di.mount_position = mount_position
+        if acc_range is not None:
+            di.range.acc = _ACC_MAP[acc_range]
+        if gyro_range is not None:
+            di.range.gyro = _GYRO_MAP[gyro_range]
+
+        # デバイス情報を書き込む
         await self.write_device_information()
 
-    async def getChecksum(self, data):
+    def _checksum(self, data):
         """
-        デバイス情報のチェックサムを計算する
+        デバイス情報のチェックサム（先頭19バイトの和の下位8ビット）を計算する
         """
-        checksum = 0
-        for i in range(0, 19):
-            checksum += data[i]
-        checksum = checksum & 0xFF
-        return checksum
+        return sum(memoryview(data)[:19]) & 0xFF
 
-    async def right_dec2hex(self, value):
+    def right_dec2hex(self, value):
         """
         10進数を16進数に変換し、右から2桁を返す
         """
-        # 16進数(大文字)で4桁ゼロ埋め
-        hex_str = format(value, '04X')
-        # 右2文字を返す
-        return hex_str[-2:]
+        # 右2桁は下位8ビットの16進数(大文字)なので、変換表から引く
+        return _HEX2[value & 0xFF]
 
     async def write_device_information(self):
         """
@@ -969,36 +1218,21 @@ class Orphe:
             print("Device information is not set, Please read device information first.")
             return
 
-        ba_write = bytearray([
-            0x09,
-            self.device_information.mount_position,
-            0x00,
-            0x00,
-            0x01,
-            0x00,
-            0x3C,
-            self.device_information.range.acc,
-            self.device_information.range.gyro,
-            0x00,
-            0x00,
-            0x00,
-            0xFF,
-            0x00,
-            0x00,
-            0x00,
-            0x00,
-            0x00,
-            self.device_information.version,
-        ])
+        di = self.device_information
+        ba_write = self._di_buf
+        ba_write[1] = di.mount_position
+        ba_write[7] = di.range.acc
+        ba_write[8] = di.range.gyro
+        ba_write[18] = di.version
 
-        checksum = await self.getChecksum(ba_write)
-        checksum_hex = await self.right_dec2hex(checksum)
-        ba_write = ba_write + bytearray([checksum])  # 19バイト目にチェックサムを設定
+        checksum = self._checksum(ba_write)
+        checksum_hex = self.right_dec2hex(checksum)
+        ba_write[19] = checksum  # 19バイト目にチェックサムを設定
 
         print(f"data: {list(ba_write)}, size: {len(ba_write)}")
         print(f"checksum: {checksum}, hex: {checksum_hex}")
 
-        await self.client.write_gatt_char(CHARACTERISTIC_DEVICE_INFORMATION_UUID, ba_write)
+        await self.client.write_gatt_char(self._device_information_char, ba_write)
 
         # 100ms待つ（これがないと即座にdevice informationを読み込まれると正しいデータ取得ができないため）
         await asyncio.sleep(WRITE_WAIT_INTERVAL_SEC)
@@ -1008,22 +1242,7 @@ class Orphe:
         acc_range(int): 2,4,8,16G を順番に 0,1,2,3 で指定
         Returns: None
         """
-        # acc_rangeの値は2,4,8,16のいずれかなので、チェックする
-        if acc_range != 2 and acc_range != 4 and acc_range != 8 and acc_range != 16:
-            print("acc_range must be 2, 4, 8, or 16[g].")
-            return
-
-        # acc_range を 0,1,2,3 に変換
-        acc_range = [2, 4, 8, 16].index(acc_range)
-
-        # デバイス情報を読み込む
-        di = await self.read_device_information()
-
-        # デバイス情報のレンジ設定を変更
-        di.range.acc = acc_range
-
-        # デバイス情報を書き込む
-        await self.write_device_information()
+        await self.configure(acc_range=acc_range)
 
     async def set_data_streaming_mode(self, mode=4):
         """
@@ -1039,7 +1258,7 @@ class Orphe:
             print("mode must be 1, 3, or 4.")
             return
         ba_write = bytearray([0x0D, mode])
-        await self.client.write_gatt_char(CHARACTERISTIC_DEVICE_INFORMATION_UUID, ba_write)
+        await self.client.write_gatt_char(self._device_information_char, ba_write)
         # 指定ms待つ（これがないと即座にdevice informationを読み込まれると正しいデータ取得ができないため）
         await asyncio.sleep(WRITE_WAIT_INTERVAL_SEC)
 
@@ -1048,50 +1267,77 @@ class Orphe:
         gyro_range(int): 250,500,1000,2000[deg/s] を順番に 0,1,2,3 で指定
         Returns: None
         """
-        # acc_rangeの値は2,4,8,16のいずれかなので、チェックする
-        if gyro_range != 250 and gyro_range != 500 and gyro_range != 1000 and gyro_range != 2000:
-            print("gyro_range must be 250, 500, 1000, or 2000[deg/s].")
-            return
-
-        # gyro_range を 0,1,2,3 に変換
-        gyro_range = [250, 500, 1000, 2000].index(gyro_range)
-
-        # デバイス情報を読み込む
-        di = await self.read_device_information()
-
-        # デバイス情報のレンジ設定を変更
-        di.range.gyro = gyro_range
-
-        await self.write_device_information()
+        await self.configure(gyro_range=gyro_range)
 
-    async def sensor_values_notification_handler(self, sender, data):
+    def sensor_values_notification_handler(self, sender, data):
         """
-        センサの値を取得したときに呼び出されるハンドラ
+        センサの値を取得したときに呼び出されるハンドラ。
+        受信データをキューに積むだけにして、解析とコールバック関数の呼び出しは別タスクで行う。
+        キューが一杯の場合は最も古いデータを破棄する（破棄した分はシリアル番号の欠損として通知される）
         """
-        if (self.is_connected() == False):
+        queue = self._sensor_values_queue
+        # 解析対象のパケット（ヘッダが50, 55, 56）以外は積まない
+        if queue is None or data[0] not in _SENSOR_LAYOUTS:
             return
+        data = bytes(data)
+        try:
+            queue.put_nowait(data)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(data)
+            self.dropped_count += 1
 
-        # データの長さを確認
-        if data[0] == 50 or data[0] == 55 or data[0] == 56:
-            sensor_values = SensorValuesData(
-                self, data, self.device_information.range)
-            if (sensor_values.serial_number - self.serial_number_prev) > 1:
-                # データ欠損の場合
-                # コールバック関数が設定されている場合、コールバック関数を呼び出す
-                if hasattr(self, 'lost_data_callback') and self.lost_data_callback:
-                    self.lost_data_callback(
-                        self.serial_number_prev, sensor_values.serial_number)
-            self.serial_number_prev = sensor_values.serial_number
-        elif data[0] == 40:
-            sensor_values = SensorValuesData(
-                self, data, self.device_information.range)
+    async def _consume_sensor_values(self):
+        """
+        キューからセンサ値を取り出して解析する
+        """
+        queue = self._sensor_values_queue
+        while True:
+            data = await queue.get()
+            try:
+                self._handle_sensor_values(data)
+            except Exception:
+                # コールバック関数内の例外で解析タスクが止まらないようにする
+                _log.exception("Error while handling sensor values")
+
+    def _handle_sensor_values(self, data):
+        """
+        センサの値（ヘッダが50, 55, 56のパケット）を解析し、コールバック関数を呼び出す
+        """
+        sensor_values = SensorValuesData(
+            self, data, self.device_information.range)
+        serial_number = sensor_values.serial_number
+        serial_number_prev = self.serial_number_prev
+        # 通知開始後の最初のパケットは比較対象が無いので欠損の判定をしない
+        # シリアルナンバーは16bitなので、65535から0への折り返しも1つ進んだとみなす
+        if serial_number_prev is not None and ((serial_number - serial_number_prev) & 0xFFFF) > 1:
+            # データ欠損の場合
+            # コールバック関数が設定されている場合、コールバック関数を呼び出す
+            if self.lost_data_callback is not None:
+                self.lost_data_callback(serial_number_prev, serial_number)
+        self.serial_number_prev = serial_number
+
+    def _stop_sensor_values_task(self):
+        """
+        センサ値の解析タスクを停止し、未処理のデータを破棄する
+        """
+        if self._sensor_values_task is not None:
+            self._sensor_values_task.cancel()
+            self._sensor_values_task = None
+        self._sensor_values_queue = None
 
     async def start_sensor_values_notification(self):
         """
         センサの値の通知を開始する。ただしセンサ値のレンジを取得しておかないといけないので、最初にデバイス情報を取得する
         """
         await self.read_device_information()
-        await self.client.start_notify(CHARACTERISTIC_SENSOR_VALUES_UUID, self.sensor_values_notification_handler)
+        self._stop_sensor_values_task()
+        # 再接続後などはデバイス側のシリアルナンバーが変わっているので、欠損判定をやり直す
+        self.serial_number_prev = None
+        self._sensor_values_queue = asyncio.Queue(maxsize=SENSOR_VALUES_QUEUE_SIZE)
+        self._sensor_values_task = asyncio.create_task(
+            self._consume_sensor_values())
+        await self.client.start_notify(self._sensor_values_char, self.sensor_values_notification_handler)
 
     async def step_analysis_notification_handler(self, sender, data):
         """
@@ -1104,19 +1350,20 @@ class Orphe:
         """
         ステップ解析の通知を開始する
         """
-        await self.client.start_notify(CHARACTERISTIC_STEP_ANALYSIS_UUID, self.step_analysis_notification_handler)
+        await self.client.start_notify(self._step_analysis_char, self.step_analysis_notification_handler)
 
     async def stop_sensor_values_notification(self):
         """
         センサの値の通知を停止する
         """
-        await self.client.stop_notify(CHARACTERISTIC_SENSOR_VALUES_UUID)
+        await self.client.stop_notify(self._sensor_values_char)
+        self._stop_sensor_values_task()
 
     async def stop_step_analysis_notification(self):
         """
         ステップ解析の通知を停止する
         """
-        await self.client.stop_notify(CHARACTERISTIC_STEP_ANALYSIS_UUID)
+        await self.client.stop_notify(self._step_analysis_char)
 
     async def disconnect(self):
         """
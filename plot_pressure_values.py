@@ -1,80 +1,172 @@
 import asyncio
-import matplotlib.pyplot as plt
-from collections import deque
+import multiprocessing
+import queue
 from orphe_insole import Orphe
-import matplotlib.animation as animation
-
-plot_buffer_size = 512  # バッファサイズ
-update_interval = 0.02  # 描画更新間隔（秒）
-
-# データ配列（固定長デック）
-sensors = [deque(maxlen=plot_buffer_size) for _ in range(6)]
 
+# uvloopがインストールされていれば高速なイベントループを使う（Windowsなど使えない環境では標準のものを使う）
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-# プロットの初期設定
-fig, ax = plt.subplots()
-lines = [ax.plot([], [], label=f'Sensor {i+1}')[0] for i in range(6)]
-ax.legend()
-ax.set_xlim(0, plot_buffer_size)
-ax.set_ylim(0, 1024)  # 適宜調整
-
-# アニメーション更新関数
+plot_buffer_size = 512  # バッファサイズ
+update_interval = 0.02  # GUIイベントの処理と描画更新の間隔（秒）
+plot_queue_size = 64  # 描画プロセスに渡す通知の最大数（溢れた分は描画しない）
+
+
+def plot_worker(plot_queue):
+    """
+    描画用の別プロセスで実行する関数。matplotlibはこのプロセスだけで使う。
+    plot_queueから1回の通知分の圧力値(6ch)のタプルのリストを受け取って描画し、Noneを受け取るかウィンドウが閉じられたら終了する
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    # データ配列（6ch分のリングバッファ）
+    # 同じ値を2か所に書き込んでおくことで、最新plot_buffer_size個のデータを常にコピーなしの連続したスライスとして取り出せる
+    sensors = np.zeros((6, 2 * plot_buffer_size), dtype=np.float32)
+    write_index = 0  # 次に書き込む位置
+    x = np.arange(plot_buffer_size)  # 全ラインで共有するx座標
+
+    # プロットの初期設定
+    fig, ax = plt.subplots()
+    # ラインはanimated=Trueにして通常の描画（背景）には含めず、blitで個別に描画する
+    lines = [ax.plot([], [], label=f'Sensor {i+1}', animated=True)[0]
+             for i in range(6)]
+    ax.legend()
+    ax.set_autoscale_on(False)  # 軸範囲は固定
+    ax.set_xlim(0, plot_buffer_size)
+    ax.set_ylim(0, 1024)  # 適宜調整
+
+    background = None  # ラインを除いた軸領域の画像（blit用）
+
+    def store(pressures):
+        # 1回の通知分の圧力値をリングバッファに書き込む
+        nonlocal write_index
+        for values in pressures:
+            sensors[:, write_index] = values
+            sensors[:, write_index + plot_buffer_size] = values
+            write_index = (write_index + 1) % plot_buffer_size
+
+    def update():
+        # すでに更新されている圧力データをプロット
+        window = sensors[:, write_index:write_index + plot_buffer_size]
+        for i, line in enumerate(lines):
+            line.set_data(x, window[i])
+
+    def draw_lines():
+        # 背景を復元してラインだけを描き直し、軸領域だけを画面に反映する
+        fig.canvas.restore_region(background)
+        for line in lines:
+            ax.draw_artist(line)
+        fig.canvas.blit(ax.bbox)
+
+    def on_draw(event):
+        # ウィンドウのリサイズなどで全体が再描画されたら背景を取り直す
+        nonlocal background
+        background = fig.canvas.copy_from_bbox(ax.bbox)
+        for line in lines:
+            ax.draw_artist(line)
+
+    fig.canvas.mpl_connect('draw_event', on_draw)
 
+    plt.show(block=False)
+    fig.canvas.draw()  # 背景を取得するために一度だけ全体を描画
 
-def update(frame):
-    # すでに更新されている acc データをプロット
-    for i, line in enumerate(lines):
-        line.set_data(range(len(sensors[i])), sensors[i])
-    return lines
+    # 終了の指示(None)が来るかウィンドウが閉じられるまで、新しいデータが届いたときだけ再描画する
+    try:
+        while plt.fignum_exists(fig.number):
+            # GUIイベントを処理しながら最短間隔だけ待つ（データが無い間もウィンドウ操作に応答する）
+            fig.canvas.start_event_loop(update_interval)
+            # 溜まっている通知をまとめて書き込んでから1回だけ描画する
+            received = False
+            while True:
+                try:
+                    pressures = plot_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pressures is None:
+                    return
+                store(pressures)
+                received = True
+            if received:
+                update()
+                draw_lines()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        plt.close(fig)
 
 
 async def main():
-
-    def got_pressure(pressure):
-        print(f"Pressure: {[f'{p:.2f}' for p in pressure.values]}")
-        for i, p in enumerate(pressure.values):
-            sensors[i].append(p)
+    # 切断を待機ループに知らせるイベント（is_connected() をポーリングしない）
+    disconnected = asyncio.Event()
+
+    # 描画は別プロセスで行い、BLEの受信処理がmatplotlibの描画で止まらないようにする
+    ctx = multiprocessing.get_context('spawn')
+    plot_queue = ctx.Queue(maxsize=plot_queue_size)
+    plot_process = ctx.Process(
+        target=plot_worker, args=(plot_queue,), daemon=True)
+    plot_process.start()
+
+    def got_pressure_batch(pressures):
+        # 1回の通知に含まれる圧力値(6ch)のタプルのリストをまとめて受け取る
+        for values in pressures:
+            print(f"Pressure: {[f'{p:.2f}' for p in values]}")
+        try:
+            plot_queue.put_nowait(pressures)
+        except queue.Full:
+            # 描画が追いつかない場合はその通知を描画しない
+            pass
 
     def on_disconnect():
         print("Disconnected from the ORPHE CORE device.")
+        disconnected.set()
 
     def lost_data(serial_number_prev, serial_number):
         print(f"Data loss detected. {serial_number_prev} <-> {serial_number}")
 
     orphe = Orphe()
-    orphe.set_got_pressure_callback(got_pressure)
+    orphe.set_got_pressure_batch_callback(got_pressure_batch)
     orphe.set_lost_data_callback(lost_data)
+    orphe.set_on_disconnect_callback(on_disconnect)
 
-    if not await orphe.connect('5DA2B599-7083-AD42-5A6D-985CBC95F122'):
-        return
-    # if not await orphe.connect('10BDC1A0-2C23-8B6C-9F69-FFDF5CFC2891'):
-    #     return
-
-    di = await orphe.read_device_information()
-    await orphe.set_data_streaming_mode(4)
-    await orphe.start_sensor_values_notification()
-
-    # アニメーション設定（frames指定を省略して無限更新）
-    ani = animation.FuncAnimation(fig, update, interval=20, blit=True)
-
-    # ブロッキングせず（他のコールバック関数処理を止めないため）にウィンドウを表示
-    plt.show(block=False)
-
-    # BLE接続中は定期的にGUIイベント処理を行う
     try:
-        while orphe.is_connected():
-            plt.pause(update_interval)  # GUI更新
-            await asyncio.sleep(update_interval)
+        if not await orphe.connect('5DA2B599-7083-AD42-5A6D-985CBC95F122'):
+            return
+        # if not await orphe.connect('10BDC1A0-2C23-8B6C-9F69-FFDF5CFC2891'):
+        #     return
+
+        di = await orphe.read_device_information()
+        await orphe.set_data_streaming_mode(4)
+        await orphe.start_sensor_values_notification()
+
+        # 切断されるか描画ウィンドウが閉じられる（描画プロセスが終了する）まで待つ
+        disconnect_waiter = asyncio.ensure_future(disconnected.wait())
+        plot_waiter = asyncio.get_running_loop().run_in_executor(None, plot_process.join)
+        try:
+            await asyncio.wait({disconnect_waiter, plot_waiter},
+                               return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            disconnect_waiter.cancel()
+            if not disconnected.is_set() and orphe.is_connected():
+                print("Stopping notification...")
+                await orphe.stop_sensor_values_notification()
+                print("Notification stopped. Disconnecting from the device.")
+                await orphe.disconnect()
+            print("Disconnected.")
     finally:
-        if orphe.is_connected():
-            print("Stopping notification...")
-            await orphe.stop_sensor_values_notification()
-            print("Notification stopped. Disconnecting from the device.")
-            await orphe.disconnect()
-        print("Disconnected.")
+        # 描画プロセスに終了を指示し、終わらなければ強制終了する
+        try:
+            plot_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        plot_process.join(timeout=1)
+        if plot_process.is_alive():
+            plot_process.terminate()
 
 if __name__ == "__main__":
-    loop = asyncio.new_event_loop()
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     main_task = loop.create_task(main())
     try:
@@ -1,6 +1,12 @@
 import asyncio
 from orphe_insole import Orphe  # orphe_core.pyからOrpheクラスをインポート
 
+# uvloopがインストールされていれば高速なイベントループを使う（Windowsなど使えない環境では標準のものを使う）
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 async def main():
     orphe = Orphe()
@@ -10,4 +16,9 @@ async def main():
             f"Device: {device.name}(name), {device.address}(address), {adv_data.rssi}(rssi)")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()